@@ -10,13 +10,23 @@ Example usage:
     >>> print(result)
 """
 
-from .main import HeaderExtractor
 from .config import get_config, update_config
 
 __version__ = "1.1.0"
 __author__ = "Tisone Kironget"
 __email__ = "tisonkironget@gmail.com"
 
+
+def __getattr__(name):
+    # HeaderExtractor pulls in requests, so it is imported on first access
+    # rather than whenever the package (e.g. the CLI) is imported
+    if name == 'HeaderExtractor':
+        from .main import HeaderExtractor
+        globals()['HeaderExtractor'] = HeaderExtractor
+        return HeaderExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'HeaderExtractor',
     'get_config',
@@ -0,0 +1,55 @@
+"""
+JSON helpers for Header Extractor.
+
+Uses orjson when it is installed (``pip install header-extractor[fast]``) and
+falls back to the standard library json module otherwise.
+"""
+import json
+from collections.abc import Mapping
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Serialize mappings that are not dicts, e.g. requests' CaseInsensitiveDict."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: The object to serialize
+        indent: Whether to pretty-print with a two-space indent
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False,
+                      default=_default).encode('utf-8')
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string. See dumps()."""
+    return dumps(obj, indent=indent).decode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
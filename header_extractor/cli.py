@@ -3,21 +3,23 @@ Command Line Interface for Header Extractor
 """
 
 import argparse
-import json
 import sys
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from pathlib import Path
 
-from .main import HeaderExtractor
+from . import _json
 from .config import get_config, update_config
 
+if TYPE_CHECKING:
+    from .main import HeaderExtractor
+
 
 def format_result(result: Dict[str, Any], fmt: str = 'json') -> str:
     """Format the result based on the specified format.
     
     Args:
         result: The result dictionary to format
-        fmt: Output format ('json' or 'inline')
+        fmt: Output format ('json', 'inline' or 'ndjson')
         
     Returns:
         Formatted string representation of the result
@@ -40,13 +42,17 @@ def format_result(result: Dict[str, Any], fmt: str = 'json') -> str:
                     output.append(f"  {k}: {v}")
         return '\n'.join(output)
     
+    if fmt == 'ndjson':
+        return _json.dumps_str(result)
+    
     # Default to JSON
-    return json.dumps(result, indent=2)
+    return _json.dumps_str(result, indent=True)
 
 
-def process_urls(extractor: HeaderExtractor, urls: List[str], 
+def process_urls(extractor: 'HeaderExtractor', urls: List[str], 
                 output_file: Optional[str] = None, 
-                output_format: str = 'json') -> None:
+                output_format: str = 'json',
+                max_per_host: Optional[int] = None) -> None:
     """Process multiple URLs and handle output.
     
     Args:
@@ -54,22 +60,42 @@ def process_urls(extractor: HeaderExtractor, urls: List[str],
         urls: List of URLs to process
         output_file: Optional file to save results. If not specified but output_dir is set in config,
                     will save to a default-named file in that directory.
-        output_format: Output format ('json' or 'inline')
+        output_format: Output format ('json', 'inline' or 'ndjson')
+        max_per_host: Maximum number of concurrent requests to a single host.
+                     No per-host limit if None.
     """
-    results = []
+    # Save to the specified output file path, or to a default-named file
+    # in the extractor's output directory
+    save_args = ()
+    if output_file:
+        output_path = Path(output_file)
+        save_args = (output_path.name, output_path.parent)
     
-    for url in urls:
+    if output_format == 'ndjson':
+        # Stream results to stdout as they arrive and to the output file in
+        # buffered chunks, without holding them all in memory
+        def _emit():
+            for result in extractor.iter_many(urls, max_per_host=max_per_host):
+                print(format_result(result, output_format))
+                yield result
+        
         try:
-            result = extractor.send_request_and_capture_headers(url)
+            extractor.save_jsonl(_emit(), *save_args)
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user.")
+        return
+    
+    results = []
+    
+    try:
+        # Requests are sent concurrently; results come back in input order
+        for result in extractor.iter_many(urls, max_per_host=max_per_host):
             results.append(result)
             print(format_result(result, output_format))
             if len(urls) > 1:
                 print("\n" + "="*80 + "\n")  # Separator between results
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
-            break
-        except Exception as e:
-            print(f"Error processing {url}: {str(e)}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user.")
     
     # Always save to file using the extractor's save_to_file method
     # which will handle the default output directory from config
@@ -77,14 +103,7 @@ def process_urls(extractor: HeaderExtractor, urls: List[str],
         return
         
     data_to_save = results[0] if len(results) == 1 else results
-    
-    if output_file:
-        # Use specified output file path
-        output_path = Path(output_file)
-        extractor.save_to_file(data_to_save, output_path.name, output_path.parent)
-    else:
-        # Save to default location in output directory
-        extractor.save_to_file(data_to_save)
+    extractor.save_to_file(data_to_save, *save_args)
 
 
 def main():
@@ -107,6 +126,7 @@ Examples:
   header-extractor https://example.com --timeout 30
   header-extractor https://example.com --output headers.json
   header-extractor https://example.com --format inline
+  header-extractor https://example.com https://httpbin.org/headers --format ndjson
   header-extractor --set-config '{"default_timeout": 20}'
         """
     )
@@ -123,7 +143,7 @@ Examples:
     config_group = parser.add_argument_group('Configuration')
     config_group.add_argument(
         '--set-config',
-        type=json.loads,
+        type=_json.loads,
         help='Update configuration with a JSON string (e.g., \'{"default_timeout": 20}\')'
     )
     config_group.add_argument(
@@ -146,6 +166,11 @@ Examples:
         action='store_true',
         help='Use comprehensive set of headers'
     )
+    request_group.add_argument(
+        '--max-per-host',
+        type=int,
+        help='Maximum number of concurrent requests to a single host (default: no limit)'
+    )
     
     # Output options
     output_group = parser.add_argument_group('Output Options')
@@ -162,7 +187,7 @@ Examples:
     output_group.add_argument(
         '--format',
         '-f',
-        choices=['json', 'inline'],
+        choices=['json', 'inline', 'ndjson'],
         default='json',
         help='Output format (default: json)'
     )
@@ -191,12 +216,12 @@ Examples:
     if args.set_config:
         update_config(args.set_config)
         print("Configuration updated successfully.")
-        print(json.dumps(get_config(), indent=2))
+        print(_json.dumps_str(get_config(), indent=True))
         return
         
     if args.show_config:
         print("Current configuration:")
-        print(json.dumps(get_config(), indent=2))
+        print(_json.dumps_str(get_config(), indent=True))
         return
     
     # Check if URLs are provided
@@ -206,6 +231,9 @@ Examples:
         return 1
     
     try:
+        # Imported here so the config-only paths above don't load requests
+        from .main import HeaderExtractor
+        
         # Handle output directory
         output_dir = args.output_dir or config.get('output_dir', 'output')
         
@@ -225,7 +253,8 @@ Examples:
             extractor=extractor,
             urls=args.urls,
             output_file=args.output,
-            output_format=args.format
+            output_format=args.format,
+            max_per_host=args.max_per_host
         )
         
     except KeyboardInterrupt:
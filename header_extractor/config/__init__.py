@@ -16,8 +16,14 @@ Usage:
 """
 from .config import get_config, save_config, update_config
 
-# Expose the current config as CONFIG for backward compatibility
-CONFIG = get_config()
+
+def __getattr__(name):
+    # Expose the current config as CONFIG for backward compatibility, loading
+    # it on first access rather than when the package is imported
+    if name == 'CONFIG':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'CONFIG',
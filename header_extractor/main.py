@@ -5,36 +5,140 @@ Header Extractor - Main Module
 This module provides the HeaderExtractor class to extract HTTP request headers.
 """
 
-import os
-import json
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, zip_longest
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from requests.hooks import default_hooks
+from requests.models import PreparedRequest
+from requests.sessions import merge_setting
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_netrc_auth
+from urllib3.util.retry import Retry
 
+from . import _json
 from .config import get_config
 
+# Connection pool sizing for the session adapter. pool_maxsize bounds the
+# number of kept-alive connections per host, which needs to cover the number
+# of concurrent workers used by send_many().
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Bytes of encoded JSON Lines output collected before save_jsonl() writes
+JSONL_FLUSH_SIZE = 4 * 1024 * 1024
+
+_SCHEMES = ('http://', 'https://')
+
+# Adapter shared by all extractors that don't opt out, so their connection
+# pools (and kept-alive TCP/TLS connections) are shared too. This relies on
+# requests >= 2.32 keying pools on each request's TLS settings; older
+# versions let one session's verify=False leak into the others' connections
+_shared_adapter: Optional[HTTPAdapter] = None
+_shared_adapter_lock = threading.Lock()
+
+
+def _build_adapter() -> HTTPAdapter:
+    """Build a pooled adapter that retries transient gateway errors.
+    
+    The final response of a retried request is still returned as-is rather
+    than raised. Retry-After is ignored, since servers may ask for waits of
+    hours; retries only use the short exponential backoff.
+    """
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+    )
+
+
+def _get_shared_adapter() -> HTTPAdapter:
+    """Get the process-wide adapter, creating it on first use."""
+    global _shared_adapter
+    with _shared_adapter_lock:
+        if _shared_adapter is None:
+            _shared_adapter = _build_adapter()
+        return _shared_adapter
+
+
+def _ensure_scheme(url: str) -> str:
+    """Return url with an https:// scheme prepended if it has none."""
+    return url if url.startswith(_SCHEMES) else f'https://{url}'
+
+
+@lru_cache(maxsize=1024)
+def _extract_domain_cached(url: str) -> str:
+    """Extract and clean domain from URL, memoized for repeated saves."""
+    # Let urlsplit handle scheme, userinfo, port, IPv6 and case in one parse
+    host = urlsplit(url if '://' in url else f'https://{url}').hostname or ''
+    
+    # Remove www. if present
+    return host[4:] if host.startswith('www.') else host
+
+
+@lru_cache(maxsize=8)
+def _prepared_template(session_headers: Tuple[Tuple[str, str], ...],
+                       request_headers: Tuple[Tuple[str, str], ...]) -> PreparedRequest:
+    """Build a URL-less GET request with merged and validated headers.
+    
+    The result only depends on the session and request headers, so it is
+    cached and copied per URL instead of redoing the merge on every call.
+    """
+    template = PreparedRequest()
+    template.prepare_method('GET')
+    template.prepare_headers(merge_setting(
+        dict(request_headers), dict(session_headers), dict_class=CaseInsensitiveDict
+    ))
+    return template
+
 
 class HeaderExtractor:
     """A class to extract request headers sent to web pages."""
 
     def __init__(self, timeout: Optional[int] = None, 
                  custom_headers: Optional[Dict[str, str]] = None,
-                 output_dir: Optional[Union[str, Path]] = None):
+                 output_dir: Optional[Union[str, Path]] = None,
+                 config: Optional[Dict[str, Any]] = None,
+                 share_connections: bool = True):
         """Initialize the HeaderExtractor.
         
         Args:
             timeout: Request timeout in seconds. Uses config value if None.
             custom_headers: Custom headers to use. Will override defaults.
             output_dir: Custom output directory for saved files. Uses config value if None.
+            config: Configuration dictionary to use. Uses the global config if None.
+            share_connections: Whether to share the connection pool with other
+                             HeaderExtractor instances. Headers and cookies are
+                             always per instance.
         """
         # Get current configuration
-        self.config = get_config()
+        self.config = config if config is not None else get_config()
         
         # Initialize session with default timeout
         self.session = requests.Session()
+        
+        # Mount a pooled adapter so repeated requests to a host reuse
+        # kept-alive connections instead of paying a new TCP/TLS handshake,
+        # including across short-lived extractor instances
+        self.share_connections = share_connections
+        adapter = _get_shared_adapter() if share_connections else _build_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.timeout = timeout or self.config['default_timeout']
         
         # Set output directory (use provided, then config, default to 'output')
@@ -47,9 +151,23 @@ class HeaderExtractor:
         if custom_headers:
             self.session.headers.update(custom_headers)
         
+        # Comprehensive headers as ready-made (name, value) pairs for per-call merging
+        self._comprehensive_items = tuple(self.config['comprehensive_headers'].items())
+        
+        # Worker pools for send_many()/iter_many() by max_workers, created on
+        # first use and kept until close() so later batches reuse their threads
+        self._executors: Dict[int, ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
+        
+        # Output directories already created, so saves can skip the mkdir
+        self._output_dir_ready: Set[Path] = set()
+        
+        # (epoch minute, formatted timestamp) of the last generated filename
+        self._timestamp_cache: Tuple[int, str] = (-1, '')
+        
         # Ensure output directory exists if needed
         if self.config['auto_create_output_dir']:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.output_dir)
     
     def _setup_output_dir(self, output_dir: Optional[Union[str, Path]] = None) -> Path:
         """Setup the output directory.
@@ -75,7 +193,13 @@ class HeaderExtractor:
         """
         self.output_dir = Path(output_dir)
         if self.config['auto_create_output_dir']:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.output_dir)
+    
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory unless this instance already did so."""
+        if directory not in self._output_dir_ready:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready.add(directory)
     
     def _extract_domain(self, url: str) -> str:
         """Extract and clean domain from URL.
@@ -86,17 +210,7 @@ class HeaderExtractor:
         Returns:
             Cleaned domain string
         """
-        # Remove protocol and path
-        domain = url.split('//')[-1].split('/')[0]
-        
-        # Remove www. if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-            
-        # Remove port if present
-        domain = domain.split(':')[0]
-        
-        return domain
+        return _extract_domain_cached(url)
         
     def save_to_file(self, data: dict, filename: Optional[str] = None, 
                    output_dir: Optional[Union[str, Path]] = None) -> str:
@@ -124,29 +238,145 @@ class HeaderExtractor:
             extractor.save_to_file(data)
         """
         output_dir = Path(output_dir) if output_dir is not None else self.output_dir
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
         
         if not filename:
-            # Get current date and time in YYYY_MMDD_HHMM format
-            datetime_str = time.strftime("%Y_%m%d_%H%M")
-            
-            # Extract domain from URL in data or use 'unknown'
-            domain = 'unknown'
-            if isinstance(data, dict) and 'url' in data:
-                try:
-                    domain = self._extract_domain(data['url'])
-                except Exception:
-                    pass
-                    
-            filename = f"headers_{domain}_{datetime_str}.json"
+            filename = self._default_filename(data)
         
         output_path = output_dir / filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_json.dumps(data, indent=True))
             
         return str(output_path)
+    
+    def save_jsonl(self, results: Iterable[dict], filename: Optional[str] = None,
+                   output_dir: Optional[Union[str, Path]] = None,
+                   flush_size: int = JSONL_FLUSH_SIZE) -> Optional[str]:
+        """Stream results to a JSON Lines file, one compact JSON object per line.
+        
+        Encoded lines are collected in memory and written in chunks of about
+        flush_size bytes, so results may be a generator and memory use does
+        not grow with the number of results.
+        
+        Args:
+            results: Result dictionaries to save
+            filename: Output filename. If None, generates a name in format
+                     'headers_<domain>_<date>.jsonl' from the first result.
+            output_dir: Output directory. Uses instance output_dir if None.
+            flush_size: Number of buffered bytes that triggers a write.
+                       Use 0 to write every result as soon as it is produced.
+            
+        Returns:
+            Path to the saved file as a string, or None if there were no results
+        """
+        output_dir = Path(output_dir) if output_dir is not None else self.output_dir
+        output_path = None
+        f = None
+        buffer = bytearray()
+        
+        try:
+            for result in results:
+                if f is None:
+                    # Open lazily so that no file is created for empty input
+                    self._ensure_dir(output_dir)
+                    output_path = output_dir / (filename or self._default_filename(result, 'jsonl'))
+                    f = open(output_path, 'wb')
+                buffer += _json.dumps(result)
+                buffer += b'\n'
+                if len(buffer) >= flush_size:
+                    f.write(buffer)
+                    buffer.clear()
+        finally:
+            if f is not None:
+                # Also keeps results gathered before an error or interrupt
+                if buffer:
+                    f.write(buffer)
+                f.close()
+        
+        return str(output_path) if output_path is not None else None
+    
+    def _default_filename(self, data: Any, extension: str = 'json') -> str:
+        """Generate a filename in format 'headers_<domain>_<date>.<extension>'.
+        
+        Args:
+            data: Data being saved. The domain is taken from its 'url' key.
+            extension: File extension without the leading dot
+            
+        Returns:
+            The generated filename
+        """
+        # Get current date and time in YYYY_MMDD_HHMM format, formatting it
+        # at most once per minute
+        minute = int(time.time()) // 60
+        if self._timestamp_cache[0] != minute:
+            self._timestamp_cache = (minute, time.strftime("%Y_%m%d_%H%M", time.localtime(minute * 60)))
+        datetime_str = self._timestamp_cache[1]
+        
+        # Extract domain from URL in data or use 'unknown'
+        domain = 'unknown'
+        if isinstance(data, dict) and 'url' in data:
+            try:
+                domain = self._extract_domain(data['url'])
+            except Exception:
+                pass
+                
+        return f"headers_{domain}_{datetime_str}.{extension}"
+        
+    def _request_header_items(self, custom_headers: Optional[Dict[str, str]],
+                              use_comprehensive: bool) -> Tuple[Tuple[str, str], ...]:
+        """Get the extra request headers for a call as (name, value) pairs.
+        
+        Custom headers take precedence; comprehensive headers are only used
+        when no custom headers are given.
+        """
+        if custom_headers:
+            return tuple(custom_headers.items())
+        if use_comprehensive:
+            return self._comprehensive_items
+        return ()
+    
+    def _prepare_get(self, url: str, header_items: Tuple[Tuple[str, str], ...]) -> PreparedRequest:
+        """Prepare a GET request for url with the given extra headers.
+        
+        Equivalent to ``session.prepare_request(Request('GET', url, headers=...))``
+        but reuses a cached header template. Sessions holding cookies, or
+        headers that cannot be used as a cache key, take the regular path.
+        
+        Args:
+            url: The URL to prepare the request for
+            header_items: Request headers to merge over the session headers
+            
+        Returns:
+            The prepared request
+        """
+        session = self.session
+        template = None
+        if not session.cookies:
+            try:
+                template = _prepared_template(tuple(session.headers.items()), header_items)
+            except TypeError:
+                pass  # Unhashable header values
+        if template is None:
+            return session.prepare_request(
+                requests.Request('GET', url, headers=dict(header_items))
+            )
+        
+        prepared = template.copy()
+        prepared.prepare_url(url, merge_setting(None, session.params))
+        # The session jar is empty on this path, so an empty jar adds no
+        # Cookie header; it is kept on the request for redirect handling
+        prepared.prepare_cookies(RequestsCookieJar())
         
+        auth = session.auth
+        if session.trust_env and not auth:
+            auth = get_netrc_auth(url)
+        prepared.prepare_auth(auth)
+        
+        prepared.hooks = default_hooks()
+        prepared.prepare_hooks(session.hooks)
+        return prepared
+    
     def extract_request_headers(self, url: str, 
                              custom_headers: Optional[Dict[str, str]] = None,
                              use_comprehensive: bool = False) -> Dict[str, any]:
@@ -162,19 +392,13 @@ class HeaderExtractor:
         """
         try:
             # Ensure URL has a scheme
-            if not url.startswith(('http://', 'https://')):
-                url = f'https://{url}'
+            url = _ensure_scheme(url)
             
             # Use comprehensive headers if requested and no custom headers provided
-            headers = {}
-            if use_comprehensive and not custom_headers:
-                headers.update(self.config['comprehensive_headers'])
-            if custom_headers:
-                headers.update(custom_headers)
+            headers = self._request_header_items(custom_headers, use_comprehensive)
             
             # Prepare the request
-            req = requests.Request('GET', url, headers=headers)
-            prepared = self.session.prepare_request(req)
+            prepared = self._prepare_get(url, headers)
             
             return {
                 'url': url,
@@ -205,19 +429,13 @@ class HeaderExtractor:
         """
         try:
             # Ensure URL has a scheme
-            if not url.startswith(('http://', 'https://')):
-                url = f'https://{url}'
+            url = _ensure_scheme(url)
             
             # Prepare headers
-            headers = {}
-            if use_comprehensive and not custom_headers:
-                headers.update(self.config['comprehensive_headers'])
-            if custom_headers:
-                headers.update(custom_headers)
+            headers = self._request_header_items(custom_headers, use_comprehensive)
             
             # Prepare and send the request
-            req = requests.Request('GET', url, headers=headers)
-            prepared = self.session.prepare_request(req)
+            prepared = self._prepare_get(url, headers)
             
             # Send the request
             response = self.session.send(prepared, timeout=self.timeout)
@@ -250,6 +468,123 @@ class HeaderExtractor:
                 'response_headers_received': {},
                 'status': 'error'
             }
+    
+    def send_many(self, urls: Iterable[str],
+                  custom_headers: Optional[Dict[str, str]] = None,
+                  use_comprehensive: bool = False,
+                  max_workers: int = 16,
+                  max_per_host: Optional[int] = None) -> List[Dict[str, any]]:
+        """Send requests to several URLs concurrently and capture their headers.
+        
+        Requests are issued from a thread pool sharing this instance's session,
+        so the total time approaches the slowest response instead of the sum
+        of all of them.
+        
+        Args:
+            urls: The URLs to request
+            custom_headers: Custom headers to include
+            use_comprehensive: Whether to use comprehensive headers
+            max_workers: Maximum number of requests in flight at once. Values
+                       above POOL_MAXSIZE gain nothing for a single host, as
+                       extra connections are not kept alive.
+            max_per_host: Maximum number of requests in flight to a single host.
+                        Lower values make same-host batches reuse a few
+                        kept-alive connections instead of opening one per worker.
+            
+        Returns:
+            List of result dictionaries in the same order as ``urls``
+        """
+        return list(self.iter_many(urls, custom_headers, use_comprehensive,
+                                   max_workers, max_per_host))
+    
+    def iter_many(self, urls: Iterable[str],
+                  custom_headers: Optional[Dict[str, str]] = None,
+                  use_comprehensive: bool = False,
+                  max_workers: int = 16,
+                  max_per_host: Optional[int] = None) -> Iterator[Dict[str, any]]:
+        """Like send_many(), but yield each result as soon as it is available.
+        
+        Results are still yielded in the same order as ``urls``.
+        """
+        urls = list(urls)
+        
+        def _send(url: str) -> Dict[str, any]:
+            return self.send_request_and_capture_headers(
+                url, custom_headers=custom_headers, use_comprehensive=use_comprehensive
+            )
+        
+        if len(urls) <= 1:
+            yield from map(_send, urls)
+            return
+        
+        executor = self._get_executor(max_workers)
+        if not max_per_host:
+            yield from executor.map(_send, urls)
+            return
+        
+        # Group URL indexes by host
+        by_host: Dict[str, List[int]] = {}
+        for i, url in enumerate(urls):
+            host = urlsplit(url if '://' in url else f'//{url}').netloc.lower()
+            by_host.setdefault(host, []).append(i)
+        host_slots = {host: threading.Semaphore(max_per_host) for host in by_host}
+        stopped = threading.Event()
+        
+        def _send_limited(url: str, host: str) -> Optional[Dict[str, any]]:
+            with host_slots[host]:
+                if stopped.is_set():
+                    return None  # The consumer went away while this waited
+                return _send(url)
+        
+        # Submit hosts round-robin so workers waiting on one host's limit
+        # do not hold up requests to other hosts
+        hosts = {i: host for host, indexes in by_host.items() for i in indexes}
+        futures = {}
+        try:
+            for i in chain.from_iterable(zip_longest(*by_host.values())):
+                if i is not None:
+                    futures[i] = executor.submit(_send_limited, urls[i], hosts[i])
+            for i in range(len(urls)):
+                yield futures[i].result()
+        finally:
+            # Like Executor.map, drop the remaining work if the consumer stops
+            # early (break, Ctrl-C or generator close); workers already
+            # waiting on a host's limit skip their request
+            stopped.set()
+            for future in futures.values():
+                future.cancel()
+    
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Get the worker pool for max_workers, creating it on first use.
+        
+        Pools are never replaced while the extractor is open, so a batch
+        running with another max_workers value can keep submitting to its
+        own pool. Threads are started on demand, so an idle pool costs nothing.
+        """
+        with self._executor_lock:
+            executor = self._executors.get(max_workers)
+            if executor is None:
+                executor = self._executors[max_workers] = ThreadPoolExecutor(max_workers=max_workers)
+            return executor
+    
+    def close(self) -> None:
+        """Shut down the worker pools and close the session's connections.
+        
+        Connections in the shared pool are left open for other instances.
+        """
+        with self._executor_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=True)
+        if not self.share_connections:
+            self.session.close()
+    
+    def __enter__(self) -> 'HeaderExtractor':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 def main():
@@ -270,17 +605,14 @@ def main():
             'https://httpbin.org/user-agent'
         ]
     
-    # Extract information from each URL
-    for url in urls:
+    # Send all requests concurrently; results arrive in URL order
+    for url, result in zip(urls, extractor.iter_many(urls)):
         print(f"\n{'='*60}")
         print(f"Extracting request headers for: {url}")
         print('='*60)
         
-        # Extract request headers
-        result = extractor.send_request_and_capture_headers(url)
-        
         # Pretty print the results
-        print(json.dumps(result, indent=2))
+        print(_json.dumps_str(result, indent=True))
 
 
 if __name__ == "__main__":
@@ -5,16 +5,197 @@ This module provides a way to define and execute sequences of HTTP requests
 where each step can depend on data from previous steps.
 """
 
-import json
+import random
+import string
+import sys
+import threading
 import time
-from typing import Dict, List, Any, Optional, Callable, Union
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+import requests
+
+from . import _json
 from .main import HeaderExtractor
 
 
-@dataclass
+# Response statuses worth retrying, the base delay for exponential backoff
+# and the longest we wait before a retry, including for Retry-After
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_RETRY_BACKOFF = 0.3
+_RETRY_MAX_DELAY = 10.0
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Get how long to wait before retrying a failed request.
+    
+    Args:
+        error: The exception raised by the failed attempt
+        attempt: Zero-based number of the failed attempt
+        
+    Returns:
+        Delay in seconds, or None if the error is not worth retrying
+        (e.g. a 4xx response or an unsupported method)
+    """
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        if response is None or response.status_code not in _RETRY_STATUSES:
+            return None
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), _RETRY_MAX_DELAY)
+    elif not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return None
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(_RETRY_BACKOFF * (2 ** attempt), _RETRY_MAX_DELAY))
+
+
+def _retried_by_adapter(error: Exception, session: requests.Session) -> bool:
+    """Check whether the session's adapter already retried a failed response.
+    
+    The extractor's adapter retries some statuses itself (see
+    main._build_adapter), so retrying those again would multiply the
+    number of requests beyond a step's max_retries. That adapter ignores
+    Retry-After, so its waits stay within its short backoff; an adapter
+    that honours Retry-After has already slept by the time we get here.
+    """
+    response = getattr(error, 'response', None)
+    if response is None or response.request is None:
+        return False
+    request = response.request
+    retry = getattr(session.get_adapter(request.url), 'max_retries', None)
+    if retry is None:
+        return False
+    # Same check urllib3 uses to decide whether to retry a response
+    return retry.is_retry(request.method, response.status_code,
+                          'Retry-After' in response.headers)
+
+
+def _compile_extract_rules(extract_rules: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """Split each extract rule's dot-path into its parts once, up front."""
+    return {key: tuple(path.split('.')) for key, path in extract_rules.items()}
+
+
+_FORMATTER = string.Formatter()
+
+# Headers added to every step request unless the step sets them itself
+_DEFAULT_UA = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+_DEFAULT_ACCEPT = 'application/json, text/plain, */*'
+
+
+def _compile_value(value: Any) -> tuple:
+    """Classify a header/param/data value once, ahead of execution.
+    
+    Returns ``('call', fn)`` for callables, ``('fmt', template, fields)`` for
+    strings containing format fields and ``('lit', value)`` for everything
+    else, so rendering is a cheap dispatch instead of a format attempt.
+    """
+    if callable(value):
+        return ('call', value)
+    if not isinstance(value, str) or ('{' not in value and '}' not in value):
+        return ('lit', value)
+    try:
+        # Only the root name of fields like "{user.id}" or "{items[0]}" needs to be in the context
+        fields = tuple({
+            field.split('.', 1)[0].split('[', 1)[0]
+            for _, field, _, _ in _FORMATTER.parse(value)
+            if field is not None
+        })
+    except ValueError:
+        return ('lit', value)  # Malformed template, used verbatim
+    return ('fmt', value, fields)
+
+
+def _compile_mapping(mapping: Dict[str, Any]) -> Dict[str, tuple]:
+    """Compile every value of a headers/params/data dict."""
+    return {k: _compile_value(v) for k, v in mapping.items()}
+
+
+def _render_value(compiled: tuple, context: Dict[str, Any]) -> Any:
+    """Produce the value to send for a compiled value and the current context."""
+    kind = compiled[0]
+    if kind == 'lit':
+        return compiled[1]
+    if kind == 'call':
+        return compiled[1](context)
+    template, fields = compiled[1], compiled[2]
+    # Templates with fields missing from the context are sent verbatim
+    if not all(field in context for field in fields):
+        return template
+    try:
+        return template.format_map(context)
+    except (KeyError, ValueError):
+        return template
+
+
+def _render_mapping(plan: Dict[str, tuple], context: Dict[str, Any]) -> Dict[str, Any]:
+    """Render every value of a compiled headers/params/data dict."""
+    return {k: _render_value(compiled, context) for k, compiled in plan.items()}
+
+
+def _split_headers(headers: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, tuple]]:
+    """Split step headers into a ready-to-send static part and a dynamic plan.
+    
+    The static part holds literal values plus any missing default headers;
+    the dynamic plan holds callables and templates, which depend on context.
+    """
+    static = {}
+    dynamic = {}
+    for k, v in headers.items():
+        compiled = _compile_value(v)
+        if compiled[0] == 'lit':
+            static[k] = v
+        else:
+            dynamic[k] = compiled
+    
+    # Ensure required headers are present
+    if 'User-Agent' not in headers:
+        static['User-Agent'] = _DEFAULT_UA
+    if 'Accept' not in headers:
+        static['Accept'] = _DEFAULT_ACCEPT
+    
+    return static, dynamic
+
+
+# Sentinel for "key not found", since None is a valid JSON value
+_MISSING = object()
+
+
+def _get_by_dot_path(obj: Any, parts: Tuple[str, ...]) -> Any:
+    """Walk nested dicts along a pre-split dot-path.
+    
+    Each part is matched exactly first, falling back to a case-insensitive
+    match. Returns None when the path cannot be followed.
+    """
+    if not isinstance(obj, dict):
+        return None
+    current = obj
+    for part in parts:
+        if not isinstance(current, dict):
+            return None
+        # exact key match first
+        value = current.get(part, _MISSING)
+        if value is _MISSING:
+            # try case-insensitive match as fallback, scanning keys once
+            # without building a lowered copy of the dict
+            lk = part.lower()
+            value = next(
+                (v for k, v in current.items() if isinstance(k, str) and k.lower() == lk),
+                _MISSING
+            )
+            if value is _MISSING:
+                return None
+        current = value
+    return current
+
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class StepResult:
     """Result of executing a single step in the sequence."""
     name: str
@@ -23,25 +204,87 @@ class StepResult:
     error: Optional[str] = None
     response: Optional[Any] = None
     execution_time: float = 0.0
+    body: Optional[Any] = None
+
+
+@dataclass(**_DATACLASS_KWARGS)
+class Step:
+    """A single request in a sequence, see SequenceExtractor.add_step()."""
+    name: str
+    url: str
+    method: str = "GET"
+    headers: Union[Dict[str, Any], Callable[[Dict], Dict[str, Any]]] = field(default_factory=dict)
+    data: Any = None
+    params: Any = None
+    depends_on: List[str] = field(default_factory=list)
+    condition: Optional[Callable[[Dict], bool]] = None
+    extract: Dict[str, str] = field(default_factory=dict)
+    max_retries: int = 1
+    delay: float = 0
+    continue_on_failure: bool = False
+    cache: bool = True
+    # Any other add_step() keyword arguments, kept so they are saved with the sequence
+    options: Dict[str, Any] = field(default_factory=dict)
+    
+    # Derived from the fields above in __post_init__, so execute_step only
+    # formats the values that actually contain template fields
+    _extract_paths: Dict[str, Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _url_is_template: bool = field(default=True, init=False, repr=False, compare=False)
+    _static_headers: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _dynamic_headers: Optional[Dict[str, tuple]] = field(default=None, init=False, repr=False, compare=False)
+    _params_plan: Optional[Dict[str, tuple]] = field(default=None, init=False, repr=False, compare=False)
+    _data_plan: Optional[Dict[str, tuple]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.method = self.method.upper()
+        self._extract_paths = _compile_extract_rules(self.extract)
+        self._url_is_template = '{' in self.url or '}' in self.url
+        if isinstance(self.headers, dict):
+            self._static_headers, self._dynamic_headers = _split_headers(self.headers)
+        if isinstance(self.params, dict):
+            self._params_plan = _compile_mapping(self.params)
+        if isinstance(self.data, dict):
+            self._data_plan = _compile_mapping(self.data)
 
 
 class SequenceExtractor:
     """
     A class to manage and execute sequences of HTTP requests with dependencies.
+    
+    Steps whose ``depends_on`` lists do not link them to each other are
+    independent and may be executed concurrently.
     """
     
-    def __init__(self, extractor: Optional[HeaderExtractor] = None):
+    def __init__(self, extractor: Optional[HeaderExtractor] = None, max_workers: int = 1,
+                 cache_enabled: bool = True):
         """
         Initialize the sequence extractor.
         
         Args:
             extractor: Optional HeaderExtractor instance. If not provided,
                      a new one will be created.
+            max_workers: Maximum number of independent steps to run at once.
+                     The default of 1 executes every step one after another
+                     in the order they were added. Larger values run steps
+                     level by level in depends_on order, so every step must
+                     declare the steps whose data it uses.
+            cache_enabled: Whether to reuse successful GET responses for
+                     steps that repeat the same URL, headers, params and
+                     session cookies within one execute() run. The cache is
+                     cleared whenever a POST step sends its request.
         """
         self.extractor = extractor or HeaderExtractor()
-        self.steps: List[Dict] = []
+        self.max_workers = max_workers
+        self.cache_enabled = cache_enabled
+        # Successful GET responses by request, see _cache_key()
+        self._response_cache: Dict[tuple, requests.Response] = {}
+        self.steps: List[Step] = []
         self.results: Dict[str, StepResult] = {}
         self.context: Dict[str, Any] = {}
+        self._context_lock = threading.Lock()
+        # Cached result of _schedule(), with the ids of the steps it was built from
+        self._levels: Optional[List[List[Step]]] = None
+        self._levels_key: Optional[tuple] = None
     
     def add_step(
         self,
@@ -55,6 +298,9 @@ class SequenceExtractor:
         extract: Optional[Dict[str, str]] = None,
         max_retries: int = 1,
         delay: float = 0,
+        params: Optional[Dict[str, Any]] = None,
+        continue_on_failure: bool = False,
+        cache: bool = True,
         **kwargs
     ) -> None:
         """
@@ -69,23 +315,58 @@ class SequenceExtractor:
             depends_on: List of step names that must complete successfully first
             condition: Callable that receives context and returns whether to execute
             extract: Dict of {name: json_path} to extract data from response
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of retry attempts. Responses that
+                         the session's adapter already retries (e.g. 503 for
+                         GET) are not retried again.
             delay: Delay in seconds before executing this step
-            **kwargs: Additional arguments to pass to the request
+            params: Query parameters for GET requests
+            continue_on_failure: Whether the sequence keeps going if this step fails
+            cache: Whether a GET step may reuse a cached response instead of
+                   sending its request again
+            **kwargs: Additional options, stored and saved with the step
         """
-        self.steps.append({
-            "name": name,
-            "url": url,
-            "method": method.upper(),
-            "headers": headers or {},
-            "data": data,
-            "depends_on": depends_on or [],
-            "condition": condition,
-            "extract": extract or {},
-            "max_retries": max_retries,
-            "delay": delay,
-            **kwargs
-        })
+        self.steps.append(Step(
+            name=name,
+            url=url,
+            method=method,
+            headers=headers or {},
+            data=data,
+            params=params,
+            depends_on=depends_on or [],
+            condition=condition,
+            extract=extract or {},
+            max_retries=max_retries,
+            delay=delay,
+            continue_on_failure=continue_on_failure,
+            cache=cache,
+            options=kwargs,
+        ))
+        self._levels = None
+    
+    def clear_cache(self) -> None:
+        """Forget all cached responses."""
+        self._response_cache.clear()
+    
+    def _cache_key(self, step: Step, url: str, headers: Dict[str, Any], params: Any) -> Optional[tuple]:
+        """Get the response cache key for a step's request.
+        
+        Returns:
+            The key, or None if the request must not be cached (caching is
+            off, the method is not GET, or the request parts aren't hashable)
+        """
+        if not self.cache_enabled or step.method != "GET" or not step.cache:
+            return None
+        try:
+            params_key = frozenset(params.items()) if isinstance(params, dict) else params
+            # Session cookies change what the server returns, e.g. after a login
+            cookies_key = tuple(sorted(
+                (c.domain, c.path, c.name, c.value) for c in self.extractor.session.cookies
+            ))
+            key = (step.method, url, frozenset(headers.items()), params_key, cookies_key)
+            hash(key)
+        except TypeError:
+            return None
+        return key
     
     def _evaluate_condition(self, condition: Callable[[Dict], bool], context: Dict) -> bool:
         """Safely evaluate a condition function."""
@@ -94,168 +375,146 @@ class SequenceExtractor:
         except Exception:
             return False
     
-    def _extract_data(self, response: Any, extract_rules: Dict[str, str]) -> Dict[str, Any]:
-        """Extract data from response according to rules."""
-        extracted = {}
+    def _parse_body(self, response: Any) -> Any:
+        """Decode a response body as JSON, or None if it isn't JSON."""
+        # Skip the parse attempt, and its exception, for bodies declared as
+        # something else (HTML, images, ...); covers application/*+json too
+        content_type = response.headers.get('Content-Type')
+        if content_type and 'json' not in content_type.lower():
+            return None
         try:
-            data = response.json() if hasattr(response, 'json') else response.text
-
-            def _get_by_dot_path(obj: Any, dot_path: str) -> Any:
-                # Supports simple dot-separated traversal for dicts
-                if not isinstance(obj, dict):
-                    return None
-                current = obj
-                for part in dot_path.split('.'):
-                    if not isinstance(current, dict):
-                        return None
-                    # exact key match first
-                    if part in current:
-                        current = current[part]
-                        continue
-                    # try case-insensitive match as fallback
-                    lowered = {str(k).lower(): k for k in current.keys()}
-                    lk = part.lower()
-                    if lk in lowered:
-                        current = current[lowered[lk]]
-                    else:
-                        return None
-                return current
-
-            for key, path in extract_rules.items():
-                if isinstance(data, dict):
-                    # dot-path or direct key
-                    value = _get_by_dot_path(data, path) if '.' in path else data.get(path)
-                    if value is not None:
-                        extracted[key] = value
-                # no elif for text; only JSON extraction supported for now
-                    
-        except Exception as e:
-            pass  # Silently fail extraction
-            
+            # Parse the raw body bytes directly (orjson when available)
+            return _json.loads(response.content)
+        except Exception:
+            return None
+    
+    def _extract_data(self, body: Any, extract_paths: Dict[str, Tuple[str, ...]]) -> Dict[str, Any]:
+        """Extract data from a decoded response body according to pre-split extract rules."""
+        extracted = {}
+        # only JSON object extraction supported for now
+        if not isinstance(body, dict):
+            return extracted
+        
+        for key, parts in extract_paths.items():
+            # dot-path or direct key
+            value = _get_by_dot_path(body, parts) if len(parts) > 1 else body.get(parts[0])
+            if value is not None:
+                extracted[key] = value
+        
         return extracted
     
-    def execute_step(self, step: Dict) -> StepResult:
+    def _render_request_value(self, value: Any, plan: Optional[Dict[str, tuple]]) -> Any:
+        """Render a step's params or data against the current context.
+        
+        Callables are called with the context and their result used as-is;
+        dicts have each value rendered; anything else is passed through.
+        """
+        if callable(value):
+            return value(self.context)
+        if not isinstance(value, dict):
+            return value
+        if plan is None:
+            plan = _compile_mapping(value)
+        return _render_mapping(plan, self.context)
+    
+    def execute_step(self, step: Step) -> StepResult:
         """Execute a single step in the sequence."""
-        step_name = step["name"]
+        step_name = step.name
         result = StepResult(name=step_name, success=False)
         start_time = time.time()
         
         try:
             # Check dependencies
-            for dep in step["depends_on"]:
+            for dep in step.depends_on:
                 if dep not in self.results or not self.results[dep].success:
                     raise Exception(f"Dependency {dep} failed or not executed")
             
             # Check condition
-            if step["condition"] and not self._evaluate_condition(step["condition"], self.context):
+            if step.condition and not self._evaluate_condition(step.condition, self.context):
                 result.success = True
                 result.data["skipped"] = True
                 result.execution_time = time.time() - start_time
                 return result
             
             # Apply delay if specified
-            if step["delay"] > 0:
-                time.sleep(step["delay"])
+            if step.delay > 0:
+                time.sleep(step.delay)
             
             # Prepare request
-            url = step["url"].format(**self.context)
-            
-            # Handle callable headers and data
-            headers = step.get("headers", {})
+            url = step.url
+            if step._url_is_template:
+                url = url.format(**self.context)
             
-            # Process headers - handle callables and string formatting
-            processed_headers = {}
+            # Process headers - start from the precomputed static headers and
+            # only render the callables and templates
+            headers = step.headers
+            static_headers = step._static_headers
             if callable(headers):
                 headers = headers(self.context) or {}
-            
-            for k, v in headers.items():
-                if callable(v):
-                    # If the value is a callable, call it with the context
-                    processed_headers[k] = v(self.context)
-                elif isinstance(v, str):
-                    # If it's a string, try to format it with context
-                    try:
-                        processed_headers[k] = v.format(**self.context)
-                    except (KeyError, ValueError):
-                        processed_headers[k] = v
-                else:
-                    processed_headers[k] = v
-            
-            # Ensure required headers are present
-            if 'User-Agent' not in processed_headers:
-                processed_headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            if 'Accept' not in processed_headers:
-                processed_headers['Accept'] = 'application/json, text/plain, */*'
+                static_headers = None
+            if static_headers is None:
+                static_headers, dynamic_headers = _split_headers(headers)
+            else:
+                dynamic_headers = step._dynamic_headers
+            processed_headers = static_headers.copy()
+            if dynamic_headers:
+                processed_headers.update(_render_mapping(dynamic_headers, self.context))
             
             # Get request params and data with callable + formatting support
-            params = step.get("params")
-            if callable(params):
-                params = params(self.context)
-            elif isinstance(params, dict):
-                formatted_params = {}
-                for pk, pv in params.items():
-                    if callable(pv):
-                        formatted_params[pk] = pv(self.context)
-                    elif isinstance(pv, str):
-                        try:
-                            formatted_params[pk] = pv.format(**self.context)
-                        except (KeyError, ValueError):
-                            formatted_params[pk] = pv
-                    else:
-                        formatted_params[pk] = pv
-                params = formatted_params
-
-            data = step.get("data")
-            if callable(data):
-                data = data(self.context)
-            elif isinstance(data, dict):
-                formatted_data = {}
-                for dk, dv in data.items():
-                    if callable(dv):
-                        formatted_data[dk] = dv(self.context)
-                    elif isinstance(dv, str):
-                        try:
-                            formatted_data[dk] = dv.format(**self.context)
-                        except (KeyError, ValueError):
-                            formatted_data[dk] = dv
-                    else:
-                        formatted_data[dk] = dv
-                data = formatted_data
+            params = self._render_request_value(step.params, step._params_plan)
+            data = self._render_request_value(step.data, step._data_plan)
             
-            # Execute request with retries
-            for attempt in range(step["max_retries"] + 1):
-                try:
-                    request_kwargs = {
-                        'url': url,
-                        'headers': processed_headers,
-                        'timeout': self.extractor.timeout
-                    }
+            # Reuse a cached response for repeated GETs, otherwise execute
+            # the request with retries
+            cache_key = self._cache_key(step, url, processed_headers, params)
+            response = self._response_cache.get(cache_key) if cache_key is not None else None
+            if response is None:
+                for attempt in range(step.max_retries + 1):
+                    try:
+                        request_kwargs = {
+                            'url': url,
+                            'headers': processed_headers,
+                            'timeout': self.extractor.timeout
+                        }
                     
-                    if step["method"] == "GET":
-                        request_kwargs['params'] = params
-                        response = self.extractor.session.get(**request_kwargs)
-                    elif step["method"] == "POST":
-                        request_kwargs['json'] = data
-                        response = self.extractor.session.post(**request_kwargs)
-                    else:
-                        raise ValueError(f"Unsupported HTTP method: {step['method']}")
+                        if step.method == "GET":
+                            request_kwargs['params'] = params
+                            response = self.extractor.session.get(**request_kwargs)
+                        elif step.method == "POST":
+                            request_kwargs['json'] = data
+                            try:
+                                response = self.extractor.session.post(**request_kwargs)
+                            finally:
+                                # A POST may change what any cached GET would return
+                                self._response_cache.clear()
+                        else:
+                            raise ValueError(f"Unsupported HTTP method: {step.method}")
                     
-                    response.raise_for_status()
-                    break
-                except Exception as e:
-                    if attempt == step["max_retries"]:
-                        raise
-                    time.sleep(1)  # Wait before retry
+                        response.raise_for_status()
+                        break
+                    except Exception as e:
+                        delay = _retry_delay(e, attempt)
+                        if (delay is None or attempt == step.max_retries
+                                or _retried_by_adapter(e, self.extractor.session)):
+                            raise
+                        time.sleep(delay)  # Wait before retry
+            
+                if cache_key is not None and 200 <= response.status_code < 300:
+                    self._response_cache[cache_key] = response
             
             # Extract data if needed
-            if step["extract"]:
-                extracted = self._extract_data(response, step["extract"])
-                self.context.update(extracted)
-                result.data.update(extracted)
+            extracted = {}
+            if step.extract:
+                # Decode the body once; keep it on the result for callers
+                result.body = self._parse_body(response)
+                extracted = self._extract_data(result.body, step._extract_paths)
+            result.data.update(extracted)
             
             result.success = True
             result.response = response
-            self.context[f"{step_name}_response"] = response
+            with self._context_lock:
+                self.context.update(extracted)
+                self.context[f"{step_name}_response"] = response
             
         except Exception as e:
             result.error = str(e)
@@ -264,28 +523,127 @@ class SequenceExtractor:
         result.execution_time = time.time() - start_time
         return result
     
+    def _schedule(self) -> List[List[Step]]:
+        """Get the execution levels, computing them only when steps changed.
+        
+        add_step() clears the cache; adding, removing or replacing steps in
+        ``self.steps`` directly is detected as well. The cached levels keep the
+        steps alive, so their ids cannot be reused while the cache is valid.
+        """
+        key = tuple(map(id, self.steps))
+        if self._levels is None or self._levels_key != key:
+            self._levels = self._compute_levels()
+            self._levels_key = key
+        return self._levels
+    
+    def _compute_levels(self) -> List[List[Step]]:
+        """Group steps into levels using Kahn's algorithm.
+        
+        Every step in a level only depends on steps from earlier levels, so the
+        steps within a level can run concurrently. Within a level, steps keep
+        the order in which they were added.
+        """
+        steps_by_name: Dict[str, Step] = {}
+        for step in self.steps:
+            steps_by_name.setdefault(step.name, step)  # First definition wins
+        position = {name: i for i, name in enumerate(steps_by_name)}
+        
+        # Unknown dependencies are left for execute_step to report as failures
+        indegree = {name: 0 for name in steps_by_name}
+        dependents: Dict[str, List[str]] = {name: [] for name in steps_by_name}
+        for name, step in steps_by_name.items():
+            for dep in set(step.depends_on):
+                if dep in steps_by_name and dep != name:
+                    indegree[name] += 1
+                    dependents[dep].append(name)
+        
+        levels = []
+        level = [name for name in steps_by_name if indegree[name] == 0]
+        while level:
+            levels.append(level)
+            next_level = []
+            for name in level:
+                for child in dependents[name]:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        next_level.append(child)
+            next_level.sort(key=position.__getitem__)
+            level = next_level
+        
+        # Steps caught in a dependency cycle run last and fail their dependency check
+        scheduled = {name for level in levels for name in level}
+        remaining = [name for name in steps_by_name if name not in scheduled]
+        if remaining:
+            levels.append(remaining)
+        
+        return [[steps_by_name[name] for name in level] for level in levels]
+    
     def execute(self) -> Dict[str, StepResult]:
-        """Execute all steps in the sequence."""
+        """Execute all steps in the sequence.
+        
+        With max_workers=1, steps run one after another in the order they
+        were added, and execution stops at the first failing step unless it
+        sets continue_on_failure.
+        
+        With max_workers > 1, steps run level by level in depends_on order and
+        independent steps within a level run concurrently. Execution stops
+        after the level in which a step fails, but the other steps of that
+        level still run.
+        """
         self.results = {}
+        self._response_cache.clear()  # Responses are only reused within a run
+        if self.max_workers <= 1:
+            for step in self.steps:
+                if step.name in self.results:
+                    continue  # Skip already executed steps
+                
+                result = self.execute_step(step)
+                self.results[step.name] = result
+                
+                if not result.success and not step.continue_on_failure:
+                    break  # Stop on failure unless continue_on_failure is True
+            return self.results
         
-        for step in self.steps:
-            if step["name"] in self.results:
-                continue  # Skip already executed steps
+        levels = self._schedule()
+        
+        # One pool for the whole run, sized for the widest level; purely
+        # linear sequences never start one
+        widest = max((len(level) for level in levels), default=0)
+        executor = None
+        if widest > 1:
+            executor = ThreadPoolExecutor(max_workers=min(self.max_workers, widest))
+        
+        try:
+            for level in levels:
+                if len(level) > 1:
+                    level_results = list(executor.map(self.execute_step, level))
+                else:
+                    level_results = [self.execute_step(level[0])]
                 
-            result = self.execute_step(step)
-            self.results[step["name"]] = result
-            
-            if not result.success and not step.get("continue_on_failure", False):
-                break  # Stop on failure unless continue_on_failure is True
+                stop = False
+                for step, result in zip(level, level_results):
+                    self.results[step.name] = result
+                    if not result.success and not step.continue_on_failure:
+                        stop = True  # Stop on failure unless continue_on_failure is True
+                if stop:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         return self.results
     
     def save_sequence(self, filepath: Union[str, Path]) -> None:
         """Save the sequence definition to a file."""
-        def _serialize_step(step: Dict[str, Any]) -> Dict[str, Any]:
+        def _serialize_step(step: Step) -> Dict[str, Any]:
+            # Derived fields are skipped and rebuilt on load; extra options
+            # are saved alongside the regular fields
+            items = [(f.name, getattr(step, f.name)) for f in fields(step) if f.init and f.name != 'options']
+            items.extend(step.options.items())
+            
             # Remove or stringify non-serializable callables
             serializable = {}
-            for k, v in step.items():
+            for k, v in items:
                 if callable(v):
                     # store a hint for debugging but avoid trying to reload functions
                     serializable[k] = f"<callable:{getattr(v, '__name__', 'anonymous')}>"
@@ -300,17 +658,18 @@ class SequenceExtractor:
             return serializable
 
         serializable_steps = [_serialize_step(s) for s in self.steps]
-        with open(filepath, 'w') as f:
-            json.dump(serializable_steps, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_json.dumps(serializable_steps, indent=True))
     
     @classmethod
     def load_sequence(cls, filepath: Union[str, Path], extractor: Optional[HeaderExtractor] = None) -> 'SequenceExtractor':
         """Load a sequence definition from a file."""
-        with open(filepath, 'r') as f:
-            steps = json.load(f)
+        with open(filepath, 'rb') as f:
+            steps = _json.loads(f.read())
         
         seq = cls(extractor)
-        seq.steps = steps
+        for step in steps:
+            seq.add_step(**{k: v for k, v in step.items() if not k.startswith('_')})
         return seq
 
 
@@ -19,7 +19,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/TisoneK/header-extractor",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     package_data={
         'header_extractor': ['config/*.json'],
     },
@@ -40,6 +40,10 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.8"],
+        "test": ["pytest>=7"],
+    },
     entry_points={
         "console_scripts": [
             "header-extractor=header_extractor.cli:main",
@@ -0,0 +1,72 @@
+"""Shared fixtures: a local HTTP server and extractors that talk to it."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from header_extractor.main import HeaderExtractor
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Echo handler backed by a counter that POST requests increment.
+
+    Every response is JSON holding the request path, the counter value and
+    the Cookie header received. POST /login also sets a session cookie.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, extra_headers=()):
+        body = json.dumps({
+            'path': self.path,
+            'value': self.server.value,
+            'cookie': self.headers.get('Cookie'),
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in extra_headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(('GET', self.path))
+        self._reply()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with self.server.lock:
+            self.server.requests.append(('POST', self.path))
+            self.server.value += 1
+        extra = [('Set-Cookie', 'sid=abc; Path=/')] if self.path == '/login' else []
+        self._reply(extra)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """A running local server; ``server.url`` is its base URL."""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.value = 0
+    httpd.requests = []
+    httpd.lock = threading.Lock()
+    httpd.url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    """An extractor with its own connection pool, saving under tmp_path."""
+    extractor = HeaderExtractor(output_dir=tmp_path, share_connections=False)
+    yield extractor
+    extractor.close()
@@ -0,0 +1,66 @@
+"""Tests for HeaderExtractor request preparation."""
+
+import pytest
+import requests
+
+
+URLS = [
+    'https://example.com',
+    'https://example.com/a?b=1',
+    'http://example.com:8080/path/with%20space',
+]
+
+
+def assert_same_request(extractor, url, header_items):
+    prepared = extractor._prepare_get(url, header_items)
+    expected = extractor.session.prepare_request(
+        requests.Request('GET', url, headers=dict(header_items))
+    )
+    assert prepared.method == expected.method
+    assert prepared.url == expected.url
+    assert dict(prepared.headers) == dict(expected.headers)
+    assert prepared.body == expected.body
+
+
+@pytest.mark.parametrize('url', URLS)
+def test_prepare_get_matches_prepare_request(extractor, url):
+    assert_same_request(extractor, url, ())
+
+
+@pytest.mark.parametrize('url', URLS)
+def test_prepare_get_matches_with_comprehensive_headers(extractor, url):
+    assert_same_request(extractor, url, extractor._comprehensive_items)
+
+
+def test_prepare_get_custom_headers_override_session_headers(extractor):
+    header_items = (('User-Agent', 'custom/1.0'), ('X-Test', '1'))
+    assert_same_request(extractor, 'https://example.com', header_items)
+    prepared = extractor._prepare_get('https://example.com', header_items)
+    assert prepared.headers['user-agent'] == 'custom/1.0'
+
+
+@pytest.mark.parametrize('url', URLS)
+def test_prepare_get_applies_session_params(extractor, url):
+    extractor.session.params = {'api_key': 'X'}
+    assert_same_request(extractor, url, ())
+    assert 'api_key=X' in extractor._prepare_get(url, ()).url
+
+
+def test_prepare_get_applies_session_auth(extractor):
+    extractor.session.auth = ('user', 'secret')
+    assert_same_request(extractor, 'https://example.com', ())
+    assert 'Authorization' in extractor._prepare_get('https://example.com', ()).headers
+
+
+def test_prepare_get_with_session_cookies(extractor):
+    extractor.session.cookies.set('sid', 'abc', domain='example.com')
+    assert_same_request(extractor, 'https://example.com/a', ())
+    assert extractor._prepare_get('https://example.com/a', ()).headers['Cookie'] == 'sid=abc'
+
+
+def test_prepare_get_returns_independent_requests(extractor):
+    first = extractor._prepare_get('https://example.com/one', ())
+    second = extractor._prepare_get('https://example.com/two', ())
+    first.headers['X-Changed'] = '1'
+    assert 'X-Changed' not in second.headers
+    assert second.url == 'https://example.com/two'
@@ -0,0 +1,261 @@
+"""Tests for SequenceExtractor."""
+
+import json
+
+import pytest
+
+from header_extractor.sequence_extractor import SequenceExtractor, Step, _get_by_dot_path
+
+
+def names(levels):
+    return [[step.name for step in level] for level in levels]
+
+
+def test_schedule_groups_steps_by_dependency_level():
+    seq = SequenceExtractor(max_workers=4)
+    seq.add_step(name='c', url='https://x/c', depends_on=['a', 'b'])
+    seq.add_step(name='a', url='https://x/a')
+    seq.add_step(name='b', url='https://x/b', depends_on=['a'])
+    seq.add_step(name='d', url='https://x/d')
+
+    assert names(seq._schedule()) == [['a', 'd'], ['b'], ['c']]
+
+
+def test_schedule_puts_cycles_last_and_ignores_unknown_dependencies():
+    seq = SequenceExtractor(max_workers=4)
+    seq.add_step(name='a', url='https://x/a', depends_on=['b'])
+    seq.add_step(name='b', url='https://x/b', depends_on=['a'])
+    seq.add_step(name='c', url='https://x/c', depends_on=['missing'])
+
+    assert names(seq._schedule()) == [['c'], ['a', 'b']]
+
+
+def test_schedule_keeps_first_definition_of_duplicate_names():
+    seq = SequenceExtractor(max_workers=4)
+    seq.add_step(name='a', url='https://x/one')
+    seq.add_step(name='a', url='https://x/two')
+
+    levels = seq._schedule()
+    assert names(levels) == [['a']]
+    assert levels[0][0].url == 'https://x/one'
+
+
+def test_schedule_is_cached_until_steps_change():
+    seq = SequenceExtractor(max_workers=4)
+    seq.add_step(name='a', url='https://x/one')
+    levels = seq._schedule()
+    assert seq._schedule() is levels
+
+    seq.add_step(name='b', url='https://x/b')
+    assert names(seq._schedule()) == [['a', 'b']]
+
+
+def test_schedule_notices_steps_replaced_in_place():
+    seq = SequenceExtractor(max_workers=4)
+    seq.add_step(name='a', url='https://x/one')
+    seq._schedule()
+
+    seq.steps[0] = Step(name='a', url='https://x/two')
+    assert seq._schedule()[0][0].url == 'https://x/two'
+
+
+def test_concurrent_execution_follows_depends_on(server, extractor):
+    seq = SequenceExtractor(extractor, max_workers=4)
+    seq.add_step(name='use', url=server.url + '/use/{value}', depends_on=['first'])
+    seq.add_step(name='first', url=server.url + '/first', extract={'value': 'value'})
+
+    results = seq.execute()
+
+    assert results['use'].success
+    assert server.requests == [('GET', '/first'), ('GET', '/use/0')]
+
+
+def test_default_execution_follows_insertion_order(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='login', url=server.url + '/login', method='POST', extract={'token': 'value'})
+    seq.add_step(name='use', url=server.url + '/use/{token}', extract={'path': 'path'})
+
+    results = seq.execute()
+
+    assert results['use'].success
+    assert results['use'].data == {'path': '/use/1'}
+
+
+def test_default_execution_stops_at_first_failure(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='a', url=server.url + '/a')
+    seq.add_step(name='bad', url=server.url + '/bad', depends_on=['missing'])
+    seq.add_step(name='c', url=server.url + '/c')
+
+    results = seq.execute()
+
+    assert list(results) == ['a', 'bad']
+    assert not results['bad'].success
+    assert server.requests == [('GET', '/a')]
+
+
+@pytest.mark.parametrize('obj, path, expected', [
+    ({'a': {'b': 1}}, ('a', 'b'), 1),
+    ({'User-Agent': 'ua'}, ('user-agent',), 'ua'),
+    ({'Headers': {'X-Id': '7'}}, ('headers', 'x-id'), '7'),
+    ({'a': {'b': 1}}, ('a', 'c'), None),
+    ({'a': 1}, ('a', 'b'), None),
+    ('text', ('a',), None),
+])
+def test_get_by_dot_path(obj, path, expected):
+    assert _get_by_dot_path(obj, path) == expected
+
+
+@pytest.mark.parametrize('value', [None, 0, False, '', {}])
+def test_get_by_dot_path_exact_falsy_value_wins_over_case_insensitive_match(value):
+    # An exact key holding a falsy value must not fall back to another key
+    assert _get_by_dot_path({'a': value, 'A': 'other'}, ('a',)) == value
+    assert _get_by_dot_path({'x': {'a': value, 'A': 'other'}}, ('x', 'a')) == value
+
+
+def test_get_by_dot_path_follows_exact_null_instead_of_case_insensitive_key():
+    assert _get_by_dot_path({'a': None, 'A': {'b': 1}}, ('a', 'b')) is None
+
+
+def test_repeated_get_reuses_cached_response(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='a', url=server.url + '/item')
+    seq.add_step(name='b', url=server.url + '/item')
+
+    results = seq.execute()
+
+    assert server.requests == [('GET', '/item')]
+    assert results['a'].response is results['b'].response
+
+
+def test_cache_opt_outs(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='a', url=server.url + '/item')
+    seq.add_step(name='b', url=server.url + '/item', cache=False)
+    seq.execute()
+    assert len(server.requests) == 2
+
+    seq = SequenceExtractor(extractor, cache_enabled=False)
+    seq.add_step(name='a', url=server.url + '/item')
+    seq.add_step(name='b', url=server.url + '/item')
+    seq.execute()
+    assert len(server.requests) == 4
+
+
+def test_cache_is_cleared_between_runs(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='a', url=server.url + '/item', extract={'value': 'value'})
+
+    seq.execute()
+    server.value = 5
+    results = seq.execute()
+
+    assert len(server.requests) == 2
+    assert results['a'].data == {'value': 5}
+
+
+def test_post_clears_cache(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='before', url=server.url + '/item', extract={'before': 'value'})
+    seq.add_step(name='change', url=server.url + '/item', method='POST', data={})
+    seq.add_step(name='after', url=server.url + '/item', extract={'after': 'value'})
+
+    results = seq.execute()
+
+    assert results['before'].data == {'before': 0}
+    assert results['after'].data == {'after': 1}
+    assert server.requests == [('GET', '/item'), ('POST', '/item'), ('GET', '/item')]
+
+
+def test_clear_cache(server, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='a', url=server.url + '/item')
+    seq.execute()
+    assert seq._response_cache
+
+    seq.clear_cache()
+    assert not seq._response_cache
+
+
+def test_cache_key_includes_session_cookies(extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='a', url='https://x/item')
+    step = seq.steps[0]
+    before = seq._cache_key(step, step.url, {}, None)
+
+    extractor.session.cookies.set('sid', 'abc')
+
+    assert seq._cache_key(step, step.url, {}, None) != before
+
+
+def test_cache_key_skips_uncacheable_requests(extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(name='post', url='https://x/item', method='POST')
+    seq.add_step(name='get', url='https://x/item')
+    post, get = seq.steps
+
+    assert seq._cache_key(post, post.url, {}, None) is None
+    assert seq._cache_key(get, get.url, {}, {'ids': [1, 2]}) is None
+    assert seq._cache_key(get, get.url, {}, {'id': '1'}) is not None
+
+
+def test_save_and_load_sequence_round_trip(tmp_path, extractor):
+    seq = SequenceExtractor(extractor)
+    seq.add_step(
+        name='login',
+        url='https://x/login',
+        method='post',
+        headers={'X-Static': '1', 'X-Token': '{token}'},
+        data={'user': '{user}', 'fixed': 2},
+        extract={'token': 'auth.token'},
+        max_retries=3,
+        delay=0.5,
+        continue_on_failure=True,
+    )
+    seq.add_step(
+        name='me',
+        url='https://x/users/{user}',
+        depends_on=['login'],
+        params={'q': '{token}'},
+        cache=False,
+        label='profile',
+    )
+    path = tmp_path / 'sequence.json'
+
+    seq.save_sequence(path)
+    loaded = SequenceExtractor.load_sequence(path, extractor)
+
+    assert loaded.extractor is extractor
+    assert loaded.steps == seq.steps
+    login, me = loaded.steps
+    assert login.method == 'POST'
+    assert me.options == {'label': 'profile'}
+    # Derived fields are rebuilt rather than saved
+    assert login._extract_paths == {'token': ('auth', 'token')}
+    assert login._static_headers['X-Static'] == '1'
+    assert set(login._dynamic_headers) == {'X-Token'}
+    assert set(login._data_plan) == {'user', 'fixed'}
+    assert me._url_is_template and set(me._params_plan) == {'q'}
+
+
+def test_save_sequence_skips_derived_fields_and_stringifies_callables(tmp_path, extractor):
+    def build_headers(context):
+        return {}
+
+    seq = SequenceExtractor(extractor)
+    seq.add_step(
+        name='a',
+        url='https://x/a',
+        headers=build_headers,
+        data={'value': lambda context: 1},
+        condition=lambda context: True,
+    )
+    path = tmp_path / 'sequence.json'
+
+    seq.save_sequence(path)
+
+    saved = json.loads(path.read_text(encoding='utf-8'))[0]
+    assert not any(key.startswith('_') for key in saved)
+    assert saved['headers'] == '<callable:build_headers>'
+    assert saved['data'] == {'value': '<callable:<lambda>>'}
+    assert saved['condition'] == '<callable:<lambda>>'